@@ -16,6 +16,8 @@
 # along with aionanoleaf.  If not, see <https://www.gnu.org/licenses/>.
 
 """aioNanoleaf."""
+__version__ = "0.2.1"
+
 from .nanoleaf import *  # noqa: F401, F403
 from .events import *  # noqa: F401, F403
 from .exceptions import *  # noqa: F401, F403
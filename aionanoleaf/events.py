@@ -18,7 +18,8 @@
 """Nanoleaf events."""
 from __future__ import annotations
 
-from abc import ABC
+import struct
+from typing import Final
 
 from .typing import (
     EffectsEventData,
@@ -34,124 +35,161 @@ SWIPE_DOWN = "Swipe Down"
 SWIPE_LEFT = "Swipe Left"
 SWIPE_RIGHT = "Swipe Right"
 
+_STATE_ATTRIBUTES: Final = {
+    1: "is_on",
+    2: "brightness",
+    3: "hue",
+    4: "saturation",
+    5: "color_temperature",
+    6: "color_mode",
+}
+_LAYOUT_ATTRIBUTES: Final = {
+    1: "layout",
+    2: "global_orientation",
+}
+# Gestures and touch types are indexed by their ID
+_GESTURES: Final = (
+    SINGLE_TAP,
+    DOUBLE_TAP,
+    SWIPE_UP,
+    SWIPE_DOWN,
+    SWIPE_LEFT,
+    SWIPE_RIGHT,
+)
+_TOUCH_TYPES: Final = ("Hover", "Down", "Hold", "Up", "Swipe")
+# Second panel ID sent in the touch stream when there is no second panel
+_TOUCH_STREAM_NONE: Final = 0xFFFF
+# Touch stream panel record: panel ID, touch type and strength nibbles and
+# the second panel ID
+_TOUCH_STREAM_PANEL: Final = struct.Struct(">HBH")
+_TOUCH_STREAM_PANEL_SIZE: Final = _TOUCH_STREAM_PANEL.size
+
+
+def _decode_touch_stream(buffer: bytes, offset: int) -> tuple[int, int, int, int]:
+    """Decode the touch stream panel record at offset."""
+    panel_id, touch, panel_id_2 = _TOUCH_STREAM_PANEL.unpack_from(buffer, offset)
+    return panel_id, touch >> 4, touch & 0xF, panel_id_2
 
-class Event(ABC):
+
+class Event:
     """Abstract Nanoleaf event."""
 
+    __slots__ = ()
+
     EVENT_TYPE_ID: int
 
 
 class StateEvent(Event):
     """Nanoleaf state event."""
 
+    __slots__ = ("_attribute_id", "_attribute", "_value")
+
     EVENT_TYPE_ID = 1
 
     def __init__(self, event_data: StateEventData) -> None:
         """Init Nanoleaf state event."""
-        self._event_data = event_data
+        self._attribute_id = event_data["attr"]
+        self._attribute = _STATE_ATTRIBUTES[self._attribute_id]
+        self._value = event_data["value"]
 
     @property
     def attribute_id(self) -> int:
         """Return attribute ID."""
-        return self._event_data["attr"]
+        return self._attribute_id
 
     @property
     def attribute(self) -> str:
         """Return event attribute."""
-        return {
-            1: "is_on",
-            2: "brightness",
-            3: "hue",
-            4: "saturation",
-            5: "color_temperature",
-            6: "color_mode",
-        }[self.attribute_id]
+        return self._attribute
 
     @property
     def value(self) -> str | int:
         """Return event value, this is the new state of the attribute."""
-        return self._event_data["value"]
+        return self._value
 
 
 class LayoutEvent(Event):
     """Nanoleaf layout event."""
 
+    __slots__ = ("_attribute_id",)
+
     EVENT_TYPE_ID = 2
 
     def __init__(self, event_data: LayoutEventData) -> None:
         """Init Nanoleaf layout event."""
-        self._event_data = event_data
+        self._attribute_id = event_data["attr"]
 
     @property
     def attribute_id(self) -> int:
         """Return event attribute ID."""
-        return self._event_data["attr"]
+        return self._attribute_id
 
     @property
     def attribute(self) -> str:
         """Return event attribute."""
-        return {
-            1: "layout",
-            2: "global_orientation",
-        }[self.attribute_id]
+        return _LAYOUT_ATTRIBUTES[self.attribute_id]
 
 
 class EffectsEvent(Event):
     """Nanoleaf effects event."""
 
+    __slots__ = ("_attribute_id", "_effect")
+
     EVENT_TYPE_ID = 3
 
     def __init__(self, event_data: EffectsEventData) -> None:
         """Init Nanoleaf effects event."""
-        self._event_data = event_data
+        self._attribute_id = event_data["attr"]
+        self._effect = event_data["value"]
 
     @property
     def attribute_id(self) -> int:
         """Return event attribute ID."""
-        return self._event_data["attr"]
+        return self._attribute_id
 
     @property
     def effect(self) -> str:
         """Return the active effect."""
-        return self._event_data["value"]
+        return self._effect
 
 
 class TouchEvent(Event):
     """Nanoleaf touch event."""
 
+    __slots__ = ("_gesture_id", "_gesture", "_panel_id")
+
     EVENT_TYPE_ID = 4
 
     def __init__(self, event_data: TouchEventData) -> None:
         """Init Nanoleaf touch event."""
-        self._event_data = event_data
+        gesture_id = self._gesture_id = event_data["gesture"]
+        if 0 <= gesture_id < len(_GESTURES):
+            self._gesture = _GESTURES[gesture_id]
+        else:
+            self._gesture = str(gesture_id)
+        self._panel_id = event_data["panelId"]
 
     @property
     def gesture_id(self) -> int:
         """Return gesture ID."""
-        return self._event_data["gesture"]
+        return self._gesture_id
 
     @property
     def gesture(self) -> str:
         """Return gesture."""
-        return {
-            0: SINGLE_TAP,
-            1: DOUBLE_TAP,
-            2: SWIPE_UP,
-            3: SWIPE_DOWN,
-            4: SWIPE_LEFT,
-            5: SWIPE_RIGHT,
-        }.get(self.gesture_id, str(self.gesture_id))
+        return self._gesture
 
     @property
     def panel_id(self) -> int | None:
         """Return panel ID if gesture has an associated panel else None."""
-        panel_id = self._event_data["panelId"]
-        return None if panel_id == -1 else panel_id
+        return None if self._panel_id == -1 else self._panel_id
 
 
 class TouchStreamEvent:
     """Nanoleaf touch stream event."""
 
+    __slots__ = ("_panel_id", "_touch_type_id", "_strength", "_panel_id_2")
+
     def __init__(
         self,
         panel_id: int,
@@ -165,6 +203,11 @@ class TouchStreamEvent:
         self._strength = strength
         self._panel_id_2 = panel_id_2
 
+    @classmethod
+    def from_buffer(cls, buffer: bytes, offset: int) -> TouchStreamEvent:
+        """Create touch stream event from the panel record at offset."""
+        return cls(*_decode_touch_stream(buffer, offset))
+
     @property
     def panel_id(self) -> int:
         """Return touch panel ID."""
@@ -178,13 +221,10 @@ class TouchStreamEvent:
     @property
     def touch_type(self) -> str:
         """Return touch type."""
-        return {
-            0: "Hover",
-            1: "Down",
-            2: "Hold",
-            3: "Up",
-            4: "Swipe",
-        }.get(self._touch_type_id, str(self._touch_type_id))
+        touch_type_id = self._touch_type_id
+        if 0 <= touch_type_id < len(_TOUCH_TYPES):
+            return _TOUCH_TYPES[touch_type_id]
+        return str(touch_type_id)
 
     @property
     def strength(self) -> int:
@@ -194,6 +234,4 @@ class TouchStreamEvent:
     @property
     def panel_id_2(self) -> int | None:
         """Return second panel ID."""
-        if self._panel_id_2 == 2 ^ 16:
-            return None
-        return self._panel_id_2
+        return None if self._panel_id_2 == _TOUCH_STREAM_NONE else self._panel_id_2
@@ -18,13 +18,12 @@
 """Nanoleaf layout."""
 from __future__ import annotations
 
-from dataclasses import dataclass
+from typing import Final, NamedTuple
 
 from .typing import PositionData
 
 
-@dataclass(frozen=True)
-class Shape:
+class Shape(NamedTuple):
     """Panel shape."""
 
     name: str
@@ -48,10 +47,38 @@ LINES_LIGHT_SINGLE_ZONE = Shape("Light Lines - Single Zone", 77)
 LINES_CONTROLLER_CAP = Shape("Controller Cap", 11)
 LINES_POWER_CONNECTOR = Shape("Power Connector", 11)
 
+_SHAPES: Final[dict[int, Shape]] = {
+    0: LIGHT_PANELS_TRIANGLE,
+    1: LIGHT_PANELS_RHYTHM,
+    2: CANVAS_SQUARE,
+    3: CANVAS_CONTROL_SQUARE_MASTER,
+    4: CANVAS_CONTROL_SQUARE_PASSIVE,
+    7: SHAPES_HEXAGON,
+    8: SHAPES_TRIANGLE,
+    9: SHAPES_MINI_TRIANGLE,
+    12: SHAPES_CONTROLLER,
+    14: ELEMENTS_HEXAGONS,
+    15: ELEMENTS_HEXAGONS_CORNER,
+    16: LINES_CONNECTOR,
+    17: LINES_LIGHT,
+    18: LINES_LIGHT_SINGLE_ZONE,
+    19: LINES_CONTROLLER_CAP,
+    20: LINES_POWER_CONNECTOR,
+}
+
 
 class Panel:
     """Nanoleaf panel."""
 
+    __slots__ = (
+        "_id",
+        "_x_coordinate",
+        "_y_coordinate",
+        "_orientation",
+        "_shape_type_id",
+        "_shape",
+    )
+
     def __init__(self, panel_data: PositionData) -> None:
         """Init Nanoleaf panel."""
         self._id = panel_data["panelId"]
@@ -59,6 +86,8 @@ class Panel:
         self._y_coordinate = panel_data["y"]
         self._orientation = panel_data["o"]
         self._shape_type_id = panel_data["shapeType"]
+        shape = _SHAPES.get(self._shape_type_id)
+        self._shape = Shape(str(self._shape_type_id), None) if shape is None else shape
 
     @property
     def id(self) -> int:
@@ -83,21 +112,4 @@ class Panel:
     @property
     def shape(self) -> Shape:
         """Return the shape."""
-        return {
-            0: LIGHT_PANELS_TRIANGLE,
-            1: LIGHT_PANELS_RHYTHM,
-            2: CANVAS_SQUARE,
-            3: CANVAS_CONTROL_SQUARE_MASTER,
-            4: CANVAS_CONTROL_SQUARE_PASSIVE,
-            7: SHAPES_HEXAGON,
-            8: SHAPES_TRIANGLE,
-            9: SHAPES_MINI_TRIANGLE,
-            12: SHAPES_CONTROLLER,
-            14: ELEMENTS_HEXAGONS,
-            15: ELEMENTS_HEXAGONS_CORNER,
-            16: LINES_CONNECTOR,
-            17: LINES_LIGHT,
-            18: LINES_LIGHT_SINGLE_ZONE,
-            19: LINES_CONTROLLER_CAP,
-            20: LINES_POWER_CONNECTOR,
-        }.get(self._shape_type_id, Shape(str(self._shape_type_id), None))
+        return self._shape
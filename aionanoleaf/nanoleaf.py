@@ -19,10 +19,10 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
 import socket
-from typing import Any, Callable
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable, Final
 
 from aiohttp import (
     ClientConnectorError,
@@ -31,10 +31,24 @@ from aiohttp import (
     ClientSession,
     ClientTimeout,
     ClientConnectionError,
+    TCPConnector,
 )
 
+try:
+    from orjson import dumps as _json_dumps, loads as _json_loads
+except ImportError:  # orjson is an optional speedup
+    import json
+
+    def _json_dumps(obj: Any) -> bytes:  # type: ignore[misc]
+        """Serialize obj to JSON bytes."""
+        return json.dumps(obj).encode()
+
+    _json_loads = json.loads  # type: ignore[assignment]
+
 from .events import (
+    _TOUCH_STREAM_PANEL_SIZE,
     EffectsEvent,
+    Event,
     LayoutEvent,
     StateEvent,
     TouchEvent,
@@ -54,11 +68,102 @@ from .typing import InfoData
 
 _LOGGER = logging.getLogger(__name__)
 
+# Attribute names of the state topics that have a range
+_STATE_RANGE_ATTRIBUTES: Final = {
+    "brightness": "brightness",
+    "hue": "hue",
+    "sat": "saturation",
+    "ct": "color_temperature",
+}
+
+_STATUS_EXCEPTIONS: Final[dict[int, type[NanoleafException]]] = {
+    401: InvalidToken,
+}
+
+
+def _state_value(value: int | bool, relative: bool) -> dict:
+    """Return the state payload for an absolute or relative value."""
+    if relative:
+        return {"increment": value}
+    return {"value": value}
+
+
+def _merge_state(
+    data: dict[str, dict],
+    update: dict[str, dict],
+    ranges: dict[str, tuple[int, int]],
+) -> None:
+    """
+    Merge state writes into data, keeping "on" as the last key.
+
+    A relative write is added to an earlier write of the same topic. An
+    increment on an absolute value becomes the absolute sum, clamped to the
+    range of the topic in ranges like the Nanoleaf clamps increments. If the
+    range is unknown, the absolute write is replaced by the increment.
+    """
+    for topic, topic_data in update.items():
+        previous = data.pop(topic, None)
+        increment = topic_data.get("increment")
+        if previous is not None and increment is not None:
+            value_range = ranges.get(topic)
+            if "increment" in previous:
+                topic_data = {**previous, **topic_data}
+                topic_data["increment"] = previous["increment"] + increment
+            elif value_range is not None:
+                topic_data = {**previous, **topic_data}
+                del topic_data["increment"]
+                minimum, maximum = value_range
+                value = previous["value"] + increment
+                topic_data["value"] = max(minimum, min(value, maximum))
+        data[topic] = topic_data
+    if "on" in data:
+        data["on"] = data.pop("on")
+
 
 class Nanoleaf:
     """Nanoleaf device."""
 
+    __slots__ = (
+        "_session",
+        "_host",
+        "_auth_token",
+        "_port",
+        "_retries",
+        "_api_url",
+        "_url_prefix",
+        "_batched_states",
+        "_name",
+        "_serial_no",
+        "_manufacturer",
+        "_firmware_version",
+        "_hardware_version",
+        "_model",
+        "_is_on",
+        "_brightness",
+        "_brightness_max",
+        "_brightness_min",
+        "_hue",
+        "_hue_max",
+        "_hue_min",
+        "_saturation",
+        "_saturation_max",
+        "_saturation_min",
+        "_color_temperature",
+        "_color_temperature_max",
+        "_color_temperature_min",
+        "_color_mode",
+        "_effects_list",
+        "_effect",
+        "_panels",
+        "_panels_by_data",
+        "__weakref__",  # Keep Nanoleaf objects weak referenceable
+    )
+
     _REQUEST_TIMEOUT = ClientTimeout(total=5, sock_connect=3)
+    _EVENTS_TIMEOUT = ClientTimeout(total=None, sock_connect=5, sock_read=None)
+    _RETRY_DELAY = 0.01
+    _EVENT_QUEUE_SIZE = 256
+    _EVENT_CALLBACKS_DRAIN_TIMEOUT = 5
 
     def __init__(
         self,
@@ -73,7 +178,30 @@ class Nanoleaf:
         self._host = host
         self._auth_token = auth_token
         self._port = port
-        self._retries = 3
+        self._retries = max(retries, 1)
+        self._api_url = f"http://{host}:{port}/api/v1"
+        self._url_prefix: str | None = None
+        # State batched by each task with an active batch() block
+        self._batched_states: dict[asyncio.Task | None, dict[str, dict]] = {}
+        self._panels: set[Panel] = set()
+        self._panels_by_data: dict[tuple[int, int, int, int, int], Panel] = {}
+        if auth_token is not None:
+            self._rebuild_url_prefix()
+
+    @staticmethod
+    def default_session() -> ClientSession:
+        """
+        Create a ClientSession suited for Nanoleaf devices.
+
+        Connections are kept alive between requests and DNS lookups are
+        cached. The event stream and requests use separate connections.
+        Call this from a running event loop and close the session when done.
+        """
+        return ClientSession(
+            connector=TCPConnector(
+                limit_per_host=4, ttl_dns_cache=300, keepalive_timeout=60
+            )
+        )
 
     @property
     def host(self) -> str:
@@ -214,44 +342,43 @@ class Nanoleaf:
         """Return a list of all panels."""
         return self._panels
 
-    @property
-    def _api_url(self) -> str:
-        return f"http://{self.host}:{self.port}/api/v1"
+    def _rebuild_url_prefix(self) -> None:
+        """Cache the authorized URL prefix for the current auth_token."""
+        self._url_prefix = f"{self._api_url}/{self._auth_token}/"
+
+    def _authorized_url(self, path: str) -> str:
+        """Return the URL for path, authorized with the auth_token."""
+        if self._url_prefix is None:
+            raise NoAuthToken(
+                "Authorize or set an auth_token before making this request."
+            )
+        return self._url_prefix + path
 
     async def _request(
         self, method: str, path: str, data: dict | None = None
     ) -> ClientResponse:
         """Make an authorized request to Nanoleaf with an auth_token."""
-        url = f"{self._api_url}/{self.auth_token}/{path}"
-        json_data = json.dumps(data)
-        err = None
-        # try self._retries times and only then raise an exception if we failed
+        url = self._authorized_url(path)
+        json_data = None if data is None else _json_dumps(data)
+        # try self._retries times, with a short backoff between attempts, and
+        # only then convert the connection error to Unavailable
         for attempt in range(self._retries):
             try:
                 resp = await self._session.request(
                     method, url, data=json_data, timeout=self._REQUEST_TIMEOUT
                 )
-                # it worked (or 401, but that's a hard fail), so clear any
-                # previous error
-                err = None
                 break
-            except Exception as e:
-                err = e
-
-        # did it work after retries?
-        if err is not None:
-            # no. we had an error; perform desired error handling (converting
-            # certain exceptions to Unavailable) and otherwise let it percolate
-            # upward.
-            try:
-                raise err
-            except ClientConnectionError as err:
-                raise Unavailable from err
-            except asyncio.TimeoutError as err:
-                raise Unavailable from err
-
-        if resp.status == 401:
-            raise InvalidToken
+            except (ClientConnectionError, asyncio.TimeoutError) as err:
+                if attempt == self._retries - 1:
+                    raise Unavailable from err
+                await asyncio.sleep(self._RETRY_DELAY * (1 << attempt))
+
+        status = resp.status
+        if 200 <= status < 300:
+            return resp
+        exception = _STATUS_EXCEPTIONS.get(status)
+        if exception is not None:
+            raise exception
         resp.raise_for_status()
         return resp
 
@@ -272,40 +399,62 @@ class Nanoleaf:
                 flashing in a pattern and call authorize() within 30 seconds."
             )
         resp.raise_for_status()
-        self._auth_token = (await resp.json())["auth_token"]
+        self._auth_token = _json_loads(await resp.read())["auth_token"]
+        self._rebuild_url_prefix()
 
     async def deauthorize(self) -> None:
         """Remove the auth_token from the Nanoleaf."""
         await self._request("delete", "")
         self._auth_token = None
+        self._url_prefix = None
 
     async def get_info(self) -> None:
         """Get all device info."""
         resp = await self._request("get", "")
-        data: InfoData = await resp.json()
+        data: InfoData = _json_loads(await resp.read())
         self._name = data["name"]
         self._serial_no = data["serialNo"]
         self._manufacturer = data["manufacturer"]
         self._firmware_version = data["firmwareVersion"]
         self._hardware_version = data.get("hardwareVersion")
         self._model = data["model"]
-        self._is_on = data["state"]["on"]["value"]
-        self._brightness = data["state"]["brightness"]["value"]
-        self._brightness_max = data["state"]["brightness"]["max"]
-        self._brightness_min = data["state"]["brightness"]["min"]
-        self._hue = data["state"]["hue"]["value"]
-        self._hue_max = data["state"]["hue"]["max"]
-        self._hue_min = data["state"]["hue"]["min"]
-        self._saturation = data["state"]["sat"]["value"]
-        self._saturation_max = data["state"]["sat"]["max"]
-        self._saturation_min = data["state"]["sat"]["min"]
-        self._color_temperature = data["state"]["ct"]["value"]
-        self._color_temperature_max = data["state"]["ct"]["max"]
-        self._color_temperature_min = data["state"]["ct"]["min"]
-        self._color_mode = data["state"]["colorMode"]
-        self._effects_list = data["effects"]["effectsList"]
-        self._effect = data["effects"]["select"]
-        self._panels = {Panel(panel) for panel in data["panelLayout"]["layout"]["positionData"]}
+        state = data["state"]
+        self._is_on = state["on"]["value"]
+        brightness = state["brightness"]
+        self._brightness = brightness["value"]
+        self._brightness_max = brightness["max"]
+        self._brightness_min = brightness["min"]
+        hue = state["hue"]
+        self._hue = hue["value"]
+        self._hue_max = hue["max"]
+        self._hue_min = hue["min"]
+        saturation = state["sat"]
+        self._saturation = saturation["value"]
+        self._saturation_max = saturation["max"]
+        self._saturation_min = saturation["min"]
+        color_temperature = state["ct"]
+        self._color_temperature = color_temperature["value"]
+        self._color_temperature_max = color_temperature["max"]
+        self._color_temperature_min = color_temperature["min"]
+        self._color_mode = state["colorMode"]
+        effects = data["effects"]
+        self._effects_list = effects["effectsList"]
+        self._effect = effects["select"]
+        # Reuse the panels that didn't change since the previous refresh
+        panels_by_data: dict[tuple[int, int, int, int, int], Panel] = {}
+        for panel_data in data["panelLayout"]["layout"]["positionData"]:
+            key = (
+                panel_data["panelId"],
+                panel_data["x"],
+                panel_data["y"],
+                panel_data["o"],
+                panel_data["shapeType"],
+            )
+            panel = self._panels_by_data.get(key)
+            panels_by_data[key] = Panel(panel_data) if panel is None else panel
+        if panels_by_data.keys() != self._panels_by_data.keys():
+            self._panels = set(panels_by_data.values())
+        self._panels_by_data = panels_by_data
 
     async def set_state(
         self,
@@ -321,26 +470,23 @@ class Nanoleaf:
         saturation_relative: bool = False,
     ) -> None:
         """Write a new state to Nanoleaf."""
-        data = {}
-
-        async def _add_topic_to_data(
-            topic: str, value: int | bool | None, relative: bool = False
-        ) -> None:
-            if value is not None:
-                if relative:
-                    data[topic] = {"increment": value}
-                else:
-                    data[topic] = {"value": value}
-
-        await _add_topic_to_data("brightness", brightness, brightness_relative)
-        if brightness_transition is not None:
-            if "brightness" in data:
+        data: dict[str, dict] = {}
+        if brightness is not None:
+            data["brightness"] = _state_value(brightness, brightness_relative)
+            if brightness_transition is not None:
                 data["brightness"]["duration"] = brightness_transition
-        await _add_topic_to_data("ct", color_temperature, color_temperature_relative)
-        await _add_topic_to_data("hue", hue, hue_relative)
-        await _add_topic_to_data("sat", saturation, saturation_relative)
-        await _add_topic_to_data("on", on)  # "on" must be the last key in data
-        if data:
+        if color_temperature is not None:
+            data["ct"] = _state_value(color_temperature, color_temperature_relative)
+        if hue is not None:
+            data["hue"] = _state_value(hue, hue_relative)
+        if saturation is not None:
+            data["sat"] = _state_value(saturation, saturation_relative)
+        if on is not None:
+            data["on"] = {"value": on}  # "on" must be the last key in data
+        batched_state = self._current_batched_state()
+        if batched_state is not None:
+            _merge_state(batched_state, data, self._state_ranges())
+        elif data:
             await self._request("put", "state", data)
 
     async def _set_state(
@@ -351,14 +497,55 @@ class Nanoleaf:
         transition: int | None = None,
     ) -> None:
         """Write state to Nanoleaf."""
-        data: dict
-        if relative:
-            data = {topic: {"increment": value}}
-        else:
-            data = {topic: {"value": value}}
+        topic_data = _state_value(value, relative)
         if transition is not None:
-            data[topic]["duration"] = transition
-        await self._request("put", "state", data)
+            topic_data["duration"] = transition
+        batched_state = self._current_batched_state()
+        if batched_state is not None:
+            _merge_state(batched_state, {topic: topic_data}, self._state_ranges())
+            return
+        await self._request("put", "state", {topic: topic_data})
+
+    def _state_ranges(self) -> dict[str, tuple[int, int]]:
+        """Return the minimum and maximum of the state topics known so far."""
+        ranges: dict[str, tuple[int, int]] = {}
+        for topic, attribute in _STATE_RANGE_ATTRIBUTES.items():
+            try:
+                ranges[topic] = (
+                    getattr(self, f"_{attribute}_min"),
+                    getattr(self, f"_{attribute}_max"),
+                )
+            except AttributeError:  # Not known before get_info()
+                continue
+        return ranges
+
+    def _current_batched_state(self) -> dict[str, dict] | None:
+        """Return the state batched by the current task, if any."""
+        if not self._batched_states:
+            return None
+        return self._batched_states.get(asyncio.current_task())
+
+    @asynccontextmanager
+    async def batch(self) -> AsyncIterator[None]:
+        """
+        Batch state writes into a single request.
+
+        State written with set_state() or the state setters while the block
+        is active is sent in one request when the block exits. Nothing is
+        sent if the block raises an exception. Only writes made by the task
+        that entered the block are batched, other tasks are not affected.
+        """
+        task = asyncio.current_task()
+        if task in self._batched_states:
+            yield  # Already batching, the outer block sends the state
+            return
+        data = self._batched_states[task] = {}
+        try:
+            yield
+        finally:
+            del self._batched_states[task]
+        if data:
+            await self._request("put", "state", data)
 
     async def set_effect(self, effect: str) -> None:
         """Write effect to Nanoleaf."""
@@ -406,21 +593,45 @@ class Nanoleaf:
         callback: Callable,
         local_ip: str | None = None,
         local_port: int | None = None,
-    ) -> int:
+    ) -> tuple[asyncio.DatagramTransport, int]:
+        """Open a UDP socket for the touch stream, return it and its port."""
         if local_ip is None:
             local_ip = "0.0.0.0"
         if local_port is None:
             local_port = 0
         loop = asyncio.get_running_loop()
-        transport, protocol = await loop.create_datagram_endpoint(
+        transport, _ = await loop.create_datagram_endpoint(
             lambda: _NanoleafTouchProtocol(self.host, callback),
             local_addr=(local_ip, local_port),
         )
         touch_socket: socket.socket = transport.get_extra_info("socket")
         socket_port = touch_socket.getsockname()[1]
         if socket_port is None:
+            transport.close()
             raise NanoleafException("Could not determine port of socket")
-        return socket_port
+        return transport, socket_port
+
+    def _apply_state_event(self, event: StateEvent) -> None:
+        """Apply a state event to this object."""
+        setattr(self, f"_{event.attribute}", event.value)
+
+    def _apply_effects_event(self, event: EffectsEvent) -> None:
+        """Apply an effects event to this object."""
+        self._effect = event.effect
+
+    def _build_events_request(
+        self, layout_events: bool, touch_events: bool, socket_port: int | None
+    ) -> tuple[str, dict[str, str] | None]:
+        """Return the URL and headers to subscribe to events."""
+        event_type_ids = [StateEvent.EVENT_TYPE_ID, EffectsEvent.EVENT_TYPE_ID]
+        if layout_events:
+            event_type_ids.append(LayoutEvent.EVENT_TYPE_ID)
+        if touch_events or socket_port is not None:
+            event_type_ids.append(TouchEvent.EVENT_TYPE_ID)
+        url = self._authorized_url(f"events?id={','.join(map(str, event_type_ids))}")
+        if socket_port is None:
+            return url, None
+        return url, {"TouchEventsPort": str(socket_port)}
 
     async def _listen_for_server_sent_events(
         self,
@@ -431,56 +642,138 @@ class Nanoleaf:
         socket_port: int | None = None,
     ) -> None:
         """Listen to events, apply changes to object and call callback with event."""
-        request_url = (
-            f"{self._api_url}/{self.auth_token}/events?"
-            f"id={StateEvent.EVENT_TYPE_ID},{EffectsEvent.EVENT_TYPE_ID}"
+        request_url, request_headers = self._build_events_request(
+            layout_callback is not None, touch_callback is not None, socket_port
         )
-        if layout_callback is not None:
-            request_url += f",{LayoutEvent.EVENT_TYPE_ID}"
-        if touch_callback is not None or socket_port is not None:
-            request_url += f",{TouchEvent.EVENT_TYPE_ID}"
-        request_headers = None
-        if socket_port is not None:
-            request_headers = {"TouchEventsPort": str(socket_port)}
-        request_timeout = ClientTimeout(total=None, sock_connect=5, sock_read=None)
-        while True:
-            try:
-                async with self._session.get(
-                    request_url, headers=request_headers, timeout=request_timeout
-                ) as resp:
-                    while True:
-                        id_line = await resp.content.readline()
-                        data_line = await resp.content.readline()
-                        await resp.content.readline()  # Empty line
-                        if resp.closed:
-                            return
-                        event_type_id = int(str(id_line)[6:-3])
-                        data = json.loads(str(data_line)[8:-3])
-                        for event_data in data["events"]:
-                            if event_type_id == StateEvent.EVENT_TYPE_ID:
-                                event = StateEvent(event_data)
-                                setattr(self, f"_{event.attribute}", event.value)
-                                if state_callback is not None:
-                                    asyncio.create_task(state_callback(event))
-                            elif event_type_id == LayoutEvent.EVENT_TYPE_ID:
-                                layout_event = LayoutEvent(event_data)
-                                if layout_callback is not None:
-                                    asyncio.create_task(layout_callback(layout_event))
-                            elif event_type_id == EffectsEvent.EVENT_TYPE_ID:
-                                effects_event = EffectsEvent(event_data)
-                                self._effect = effects_event.effect
-                                if effects_callback is not None:
-                                    asyncio.create_task(effects_callback(effects_event))
-                            elif event_type_id == TouchEvent.EVENT_TYPE_ID:
-                                touch_event = TouchEvent(event_data)
-                                if touch_callback is not None:
-                                    asyncio.create_task(touch_callback(touch_event))
-                            else:
+        # Event class, method applying the event to this object, callback and
+        # whether the callback is a coroutine function
+        handlers: dict[
+            int,
+            tuple[
+                Callable[[Any], Event],
+                Callable[[Any], None] | None,
+                Callable[[Any], Any] | None,
+                bool,
+            ],
+        ] = {
+            StateEvent.EVENT_TYPE_ID: (
+                StateEvent,
+                self._apply_state_event,
+                state_callback,
+                asyncio.iscoroutinefunction(state_callback),
+            ),
+            LayoutEvent.EVENT_TYPE_ID: (
+                LayoutEvent,
+                None,
+                layout_callback,
+                asyncio.iscoroutinefunction(layout_callback),
+            ),
+            EffectsEvent.EVENT_TYPE_ID: (
+                EffectsEvent,
+                self._apply_effects_event,
+                effects_callback,
+                asyncio.iscoroutinefunction(effects_callback),
+            ),
+            TouchEvent.EVENT_TYPE_ID: (
+                TouchEvent,
+                None,
+                touch_callback,
+                asyncio.iscoroutinefunction(touch_callback),
+            ),
+        }
+        # Coroutine callbacks run in a separate task, so slow callbacks don't
+        # hold up reading the event stream
+        callbacks: asyncio.Queue[tuple[Callable[[Any], Any], Event]] = asyncio.Queue(
+            self._EVENT_QUEUE_SIZE
+        )
+        callback_task = asyncio.create_task(self._run_event_callbacks(callbacks))
+        try:
+            while True:
+                try:
+                    async with self._session.get(
+                        request_url,
+                        headers=request_headers,
+                        timeout=self._EVENTS_TIMEOUT,
+                    ) as resp:
+                        while True:
+                            # An event is an id line, a data line and an empty line
+                            chunk = await resp.content.readuntil(b"\n\n")
+                            if resp.closed:
+                                await self._drain_event_callbacks(callbacks)
+                                return
+                            id_line, data_line, _ = chunk.split(b"\n", 2)
+                            # Field values follow the first colon
+                            event_type_id = int(id_line.partition(b":")[2])
+                            data = _json_loads(data_line.partition(b":")[2])
+                            handler = handlers.get(event_type_id)
+                            if handler is None:
                                 raise NanoleafException(
                                     f"Unknown event type id {event_type_id}"
                                 )
-            except ClientError:
-                await asyncio.sleep(5)
+                            event_class, apply_event, callback, is_coroutine = handler
+                            for event_data in data["events"]:
+                                event = event_class(event_data)
+                                if apply_event is not None:
+                                    apply_event(event)
+                                if callback is None:
+                                    continue
+                                if is_coroutine:
+                                    self._queue_event_callback(
+                                        callbacks, callback, event
+                                    )
+                                    continue
+                                # Plain callbacks run directly, schedule them
+                                # if they still return a coroutine
+                                try:
+                                    result = callback(event)
+                                except Exception:
+                                    _LOGGER.exception("Error in event callback")
+                                    continue
+                                if asyncio.iscoroutine(result):
+                                    asyncio.create_task(result)
+                except ClientError:
+                    await asyncio.sleep(5)
+        finally:
+            callback_task.cancel()
+
+    @staticmethod
+    def _queue_event_callback(
+        callbacks: asyncio.Queue[tuple[Callable[[Any], Any], Event]],
+        callback: Callable[[Any], Any],
+        event: Event,
+    ) -> None:
+        """Queue a callback call, dropping the oldest one if the queue is full."""
+        if callbacks.full():
+            callbacks.get_nowait()
+            callbacks.task_done()
+            _LOGGER.warning("Event callbacks are falling behind, dropping an event")
+        callbacks.put_nowait((callback, event))
+
+    @classmethod
+    async def _drain_event_callbacks(
+        cls, callbacks: asyncio.Queue[tuple[Callable[[Any], Any], Event]]
+    ) -> None:
+        """Wait a limited time for queued event callbacks to finish."""
+        try:
+            await asyncio.wait_for(
+                callbacks.join(), cls._EVENT_CALLBACKS_DRAIN_TIMEOUT
+            )
+        except asyncio.TimeoutError:
+            _LOGGER.warning("Event callbacks did not finish, cancelling them")
+
+    @staticmethod
+    async def _run_event_callbacks(
+        callbacks: asyncio.Queue[tuple[Callable[[Any], Any], Event]]
+    ) -> None:
+        """Call queued event callbacks one at a time, in event order."""
+        while True:
+            callback, event = await callbacks.get()
+            try:
+                await callback(event)
+            except Exception:
+                _LOGGER.exception("Error in event callback")
+            finally:
+                callbacks.task_done()
 
     async def listen_events(
         self,
@@ -493,20 +786,38 @@ class Nanoleaf:
         local_ip: str | None = None,
         local_port: int | None = None,
     ) -> None:
-        """Listen to Nanoleaf events."""
+        """
+        Listen to Nanoleaf events.
+
+        Callbacks can be coroutine functions or plain functions. Coroutine
+        event callbacks are awaited one at a time, in the order the events
+        were received. Plain callbacks are called as events arrive.
+
+        When the Nanoleaf closes the event stream, queued coroutine callbacks
+        get 5 seconds to finish. Callbacks still running or queued after that
+        are cancelled and this method returns.
+        """
+        transport: asyncio.DatagramTransport | None = None
         socket_port: int | None = None
         if touch_stream_callback is not None:
-            socket_port = await self._open_websocket_for_touch_data_stream(
+            (
+                transport,
+                socket_port,
+            ) = await self._open_websocket_for_touch_data_stream(
                 touch_stream_callback, local_ip, local_port
             )
             _LOGGER.debug("Listening for UDP touch events on socket port: %s", socket_port)
-        await self._listen_for_server_sent_events(
-            state_callback,
-            layout_callback,
-            effects_callback,
-            touch_callback,
-            socket_port,
-        )
+        try:
+            await self._listen_for_server_sent_events(
+                state_callback,
+                layout_callback,
+                effects_callback,
+                touch_callback,
+                socket_port,
+            )
+        finally:
+            if transport is not None:
+                transport.close()
 
 
 class _NanoleafTouchProtocol(asyncio.DatagramProtocol):
@@ -518,6 +829,7 @@ class _NanoleafTouchProtocol(asyncio.DatagramProtocol):
         """Init Nanoleaf UDP socket touch protocol."""
         self._nanoleaf_host = nanoleaf_host
         self._callback = callback
+        self._callback_is_coroutine = asyncio.iscoroutinefunction(callback)
 
     def connection_made(self, transport: asyncio.BaseTransport) -> None:
         """Set transport for connection."""
@@ -527,12 +839,21 @@ class _NanoleafTouchProtocol(asyncio.DatagramProtocol):
         """Receive touch events."""
         if addr[0] != self._nanoleaf_host:
             return
-        binary = bin(int.from_bytes(data, byteorder="big"))
-        binary = binary[3:]  # Remove 0b1
-        event = TouchStreamEvent(
-            panel_id=int(binary[:16], 2),  # First 2 bytes
-            touch_type_id=int(binary[16:20], 2),  # Nibble after panel id
-            strength=int(binary[20:24], 2),  # Nibble after touch type
-            panel_id_2=int(binary[24:], 2),
-        )
-        asyncio.create_task(self._callback(event))
+        # The first 2 bytes are the number of panels, then a record per panel
+        panel_count = int.from_bytes(data[:2], byteorder="big")
+        panel_count = min(panel_count, (len(data) - 2) // _TOUCH_STREAM_PANEL_SIZE)
+        end = 2 + panel_count * _TOUCH_STREAM_PANEL_SIZE
+        for offset in range(2, end, _TOUCH_STREAM_PANEL_SIZE):
+            event = TouchStreamEvent.from_buffer(data, offset)
+            if self._callback_is_coroutine:
+                asyncio.create_task(self._callback(event))
+                continue
+            # Plain callbacks run directly, schedule them if they still
+            # return a coroutine
+            try:
+                result = self._callback(event)
+            except Exception:
+                _LOGGER.exception("Error in touch stream callback")
+                continue
+            if asyncio.iscoroutine(result):
+                asyncio.create_task(result)